@@ -10,7 +10,8 @@ import os
 from car import Car
 from camera import Camera
 from track import tracks
-from math import sin, cos, radians, sqrt, atan2, degrees
+from sensor import default_rig
+from math import sqrt, atan2, degrees
 from random import randint
 from PIL import Image
 
@@ -24,11 +25,12 @@ class GameOverException(Exception):
 
 
 class AutoDrive(Env):
-    def __init__(self, render=False, track=None):
+    def __init__(self, render=False, track=None, sensor_rig=None):
         self.tracks = tracks
         self.track = track if track is not None else tracks[randint(0, len(tracks)-1)]
         self.background_img = pygame.image.load(self.track.background)
         self.background = np.asarray(Image.open(self.track.background))
+        self.wall_mask = self.background[:, :, 0] != 0
 
         car_img = pygame.image.load('car.png')
         car_img.set_colorkey((0, 0, 0))
@@ -36,10 +38,10 @@ class AutoDrive(Env):
                        car_img.get_height(),
                        self.track.initial_position,
                        self.track.initial_angle)
-        self.max_depth = 3000
+        self.sensor_rig = sensor_rig if sensor_rig is not None else default_rig
 
         self.action_space = MultiDiscrete([3, 3])
-        self.observation_space = Box(low=0, high=1, shape=(8,), dtype=float)
+        self.observation_space = Box(low=0, high=1, shape=(self.sensor_rig.observation_size + 2,), dtype=float)
 
         self.checkpoints = self.track.get_checkpoints()
 
@@ -113,20 +115,12 @@ class AutoDrive(Env):
                 raise GameOverException
 
     def get_readings(self):
-        x, y = self.car.get_front_left()
-        s1 = self.get_sensor_reading(x, y, self.car.get_correct_angle() - 90) / self.max_depth
-        s2 = self.get_sensor_reading(x, y, self.car.get_correct_angle() - 135) / self.max_depth
-        s3 = self.get_sensor_reading(x, y, self.car.get_correct_angle() - 180) / self.max_depth
-
-        x, y = self.car.get_front_right()
-        s4 = self.get_sensor_reading(x, y, self.car.get_correct_angle() - 90) / self.max_depth
-        s5 = self.get_sensor_reading(x, y, self.car.get_correct_angle() - 45) / self.max_depth
-        s6 = self.get_sensor_reading(x, y, self.car.get_correct_angle()) / self.max_depth
+        readings = self.sensor_rig.get_readings(self.car, self.wall_mask)
 
         speed = self.car.velocity.x / self.car.max_velocity
         checkpoint_angle = self.get_angle_from_next_checkpoint() / 180
 
-        return [s1, s2, s3, s4, s5, s6, speed, checkpoint_angle]
+        return np.append(readings, [speed, checkpoint_angle])
 
     def get_angle_from_next_checkpoint(self):
         checkpoint = self.checkpoints[0]
@@ -138,20 +132,6 @@ class AutoDrive(Env):
 
         return min(difference, 360 - difference)
 
-    def get_sensor_reading(self, start_x, start_y, angle):
-        return self.get_euclidian_dist(self.get_sensor_position(start_x, start_y, angle))
-
-    def get_sensor_position(self, start_x, start_y, angle):
-        for depth in range(self.max_depth):
-            target_x = int(start_x - sin(radians(angle)) * depth)
-            target_y = int(start_y + cos(radians(angle)) * depth)
-
-            try:
-                if self.background[target_y][target_x][0] != 0 or depth == self.max_depth-1:
-                    return target_x, target_y
-            except IndexError:
-                return target_x, target_y
-
     def get_euclidian_dist(self, coord):
         return sqrt((self.car.position.x - coord[0]) ** 2 + (self.car.position.y - coord[1]) ** 2)
 
@@ -174,24 +154,6 @@ class AutoDrive(Env):
                                       self.checkpoints[0][1])
 
     def draw_sensors(self):
-        x, y = self.car.get_front_left()
-        s1 = self.get_sensor_position(x, y, self.car.get_correct_angle() - 90)
-        s2 = self.get_sensor_position(x, y, self.car.get_correct_angle() - 135)
-        s3 = self.get_sensor_position(x, y, self.car.get_correct_angle() - 180)
-        self.camera.draw_line((255, 255, 0), x, y, s1[0], s1[1])
-        self.camera.draw_line((255, 255, 0), x, y, s2[0], s2[1])
-        self.camera.draw_line((255, 255, 0), x, y, s3[0], s3[1])
-        self.camera.draw_circle((255, 255, 0), (s1[0], s1[1]), 3)
-        self.camera.draw_circle((255, 255, 0), (s2[0], s2[1]), 3)
-        self.camera.draw_circle((255, 255, 0), (s3[0], s3[1]), 3)
-
-        x, y = self.car.get_front_right()
-        s4 = self.get_sensor_position(x, y, self.car.get_correct_angle() - 90)
-        s5 = self.get_sensor_position(x, y, self.car.get_correct_angle() - 45)
-        s6 = self.get_sensor_position(x, y, self.car.get_correct_angle())
-        self.camera.draw_line((255, 255, 0), x, y, s4[0], s4[1])
-        self.camera.draw_line((255, 255, 0), x, y, s5[0], s5[1])
-        self.camera.draw_line((255, 255, 0), x, y, s6[0], s6[1])
-        self.camera.draw_circle((255, 255, 0), (s4[0], s4[1]), 3)
-        self.camera.draw_circle((255, 255, 0), (s5[0], s5[1]), 3)
-        self.camera.draw_circle((255, 255, 0), (s6[0], s6[1]), 3)
+        for x, y, end_x, end_y in zip(*self.sensor_rig.get_positions(self.car, self.wall_mask)):
+            self.camera.draw_line((255, 255, 0), x, y, end_x, end_y)
+            self.camera.draw_circle((255, 255, 0), (end_x, end_y), 3)
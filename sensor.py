@@ -0,0 +1,102 @@
+import numpy as np
+from math import sin, cos, radians
+
+
+class Ray:
+    def __init__(self, mount, angle):
+        # mount is the name of a Car point getter without the 'get_' prefix, e.g. 'front_left'
+        self.mount = mount
+        self.angle = angle
+
+
+class SensorRig:
+    def __init__(self, rays, max_depth=3000, grid_size=0, grid_resolution=0):
+        if (grid_size or grid_resolution) and \
+                (grid_size <= 0 or grid_resolution <= 0 or grid_size % grid_resolution != 0):
+            raise ValueError('grid_size and grid_resolution must both be 0, '
+                             'or both positive with grid_size a multiple of grid_resolution')
+
+        self.rays = rays
+        self.max_depth = max_depth
+        self.grid_size = grid_size
+        self.grid_resolution = grid_resolution
+
+        self.mounts = sorted({ray.mount for ray in rays})
+        self.mount_index = np.array([self.mounts.index(ray.mount) for ray in rays])
+
+        # Unit direction table of each ray relative to the car, rotated by the car angle on every reading
+        self.cos_offsets = np.array([cos(radians(ray.angle)) for ray in rays])
+        self.sin_offsets = np.array([sin(radians(ray.angle)) for ray in rays])
+        self.depths = np.arange(max_depth)
+
+    @property
+    def has_grid(self):
+        return self.grid_size > 0
+
+    @property
+    def observation_size(self):
+        if not self.has_grid:
+            return len(self.rays)
+        return len(self.rays) + self.grid_resolution ** 2
+
+    def get_directions(self, car):
+        angle = radians(car.get_correct_angle())
+        sin_angle = sin(angle)
+        cos_angle = cos(angle)
+
+        dx = -(sin_angle * self.cos_offsets + cos_angle * self.sin_offsets)
+        dy = cos_angle * self.cos_offsets - sin_angle * self.sin_offsets
+        return dx, dy
+
+    def get_starts(self, car):
+        points = np.array([getattr(car, f'get_{mount}')() for mount in self.mounts])
+        return points[self.mount_index, 0], points[self.mount_index, 1]
+
+    def get_positions(self, car, wall_mask):
+        start_x, start_y = self.get_starts(car)
+        dx, dy = self.get_directions(car)
+
+        target_x = (start_x[:, None] + dx[:, None] * self.depths).astype(int)
+        target_y = (start_y[:, None] + dy[:, None] * self.depths).astype(int)
+
+        height, width = wall_mask.shape
+        inside = (target_x >= 0) & (target_x < width) & (target_y >= 0) & (target_y < height)
+        hit = ~inside
+        hit[inside] = wall_mask[target_y[inside], target_x[inside]]
+        hit[:, -1] = True
+
+        rows = np.arange(len(self.rays))
+        depth = hit.argmax(axis=1)
+        return start_x, start_y, target_x[rows, depth], target_y[rows, depth]
+
+    def get_readings(self, car, wall_mask):
+        _, _, end_x, end_y = self.get_positions(car, wall_mask)
+        distances = np.hypot(end_x - car.position.x, end_y - car.position.y) / self.max_depth
+
+        if not self.has_grid:
+            return distances
+        return np.concatenate((distances, self.get_occupancy_grid(car, wall_mask)))
+
+    def get_occupancy_grid(self, car, wall_mask):
+        # Axis-aligned crop centered on the car, anything outside the track image counts as wall
+        height, width = wall_mask.shape
+        left = int(car.position.x) - self.grid_size // 2
+        top = int(car.position.y) - self.grid_size // 2
+
+        crop = np.ones((self.grid_size, self.grid_size))
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + self.grid_size, width), min(top + self.grid_size, height)
+        if x0 < x1 and y0 < y1:
+            crop[y0 - top:y1 - top, x0 - left:x1 - left] = wall_mask[y0:y1, x0:x1]
+
+        cell = self.grid_size // self.grid_resolution
+        grid = crop.reshape(self.grid_resolution, cell, self.grid_resolution, cell).mean(axis=(1, 3))
+        return grid.ravel()
+
+
+default_rig = SensorRig([Ray('front_left', -90),
+                         Ray('front_left', -135),
+                         Ray('front_left', -180),
+                         Ray('front_right', -90),
+                         Ray('front_right', -45),
+                         Ray('front_right', 0)])